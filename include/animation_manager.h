@@ -35,10 +35,17 @@ struct Animation {
   const unsigned char* const * frames;  // Pointer to frame array in PROGMEM
   const uint16_t* durations;            // Pointer to duration array in PROGMEM
   uint8_t frameCount;
-  uint8_t width;
+  uint8_t width;                        // Screen area the frames are drawn into
   uint8_t height;
+  const uint8_t* rects;                 // Cropped frames: x, y, width, height, fill per frame
+                                        // in PROGMEM (nullptr = full width x height frames)
 };
 
+// Cropped animations (gif2bitmap.py --crop) pass their rect array as the last field:
+//   {"Fire", fire_frames, fire_durations, FIRE_FRAMES, FIRE_WIDTH, FIRE_HEIGHT, fire_rects},
+// Entries without it default to nullptr and draw full frames.
+#define FRAME_RECT_BYTES 5
+
 // ===== ONLY NEW CUSTOM ANIMATIONS =====
 const Animation ANIMATIONS[] PROGMEM = {
   // Idle is first (index 0) - Default animation
@@ -53,7 +53,7 @@ Animation getAnimation(uint8_t index) {
   return anim;
 }
 
-// Draw animation frame (full screen 128x64)
+// Draw animation frame (full width x height, or a cropped rect over its background fill)
 void drawAnimationFrame(uint8_t animIndex, uint8_t frameIndex) {
   Animation anim = getAnimation(animIndex);
   
@@ -75,8 +75,23 @@ void drawAnimationFrame(uint8_t animIndex, uint8_t frameIndex) {
     return;
   }
   
-  display.clearDisplay();
-  display.drawBitmap(0, 0, frame, anim.width, anim.height, SSD1306_WHITE);
+  if (anim.rects != nullptr) {
+    const uint8_t* rect = anim.rects + frameIndex * FRAME_RECT_BYTES;
+    uint8_t x = pgm_read_byte(&rect[0]);
+    uint8_t y = pgm_read_byte(&rect[1]);
+    uint8_t w = pgm_read_byte(&rect[2]);
+    uint8_t h = pgm_read_byte(&rect[3]);
+    uint8_t fill = pgm_read_byte(&rect[4]);
+    
+    // Background over the animation area only (same screen as the full-frame path),
+    // then every bit of the rect (0 bits included)
+    display.clearDisplay();
+    display.fillRect(0, 0, anim.width, anim.height, fill ? SSD1306_WHITE : SSD1306_BLACK);
+    display.drawBitmap(x, y, frame, w, h, SSD1306_WHITE, SSD1306_BLACK);
+  } else {
+    display.clearDisplay();
+    display.drawBitmap(0, 0, frame, anim.width, anim.height, SSD1306_WHITE);
+  }
   display.display();
 }
 
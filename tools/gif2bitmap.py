@@ -8,6 +8,9 @@ Usage:
     python3 gif2bitmap.py gif/ --batch  # Convert all GIFs in folder
 
 Output: C header files with bitmap arrays compatible with Adafruit_GFX
+
+Cropped mode (--crop) stores only each frame's byte-aligned bounding box of
+non-background pixels plus a per-frame rect array (x, y, width, height, fill).
 """
 
 import os
@@ -16,8 +19,11 @@ from PIL import Image, ImageSequence, ImageOps
 import argparse
 from pathlib import Path
 
+# Bytes stored per frame in the cropped-mode rect array (x, y, width, height, fill)
+RECT_BYTES = 5
+
 class GifToBitmapConverter:
-    def __init__(self, width=128, height=64, threshold=128):
+    def __init__(self, width=128, height=64, threshold=128, crop=False):
         """
         Initialize converter
         
@@ -25,10 +31,12 @@ class GifToBitmapConverter:
             width: Target width in pixels (default 128 for SSD1306)
             height: Target height in pixels (default 64 for SSD1306)
             threshold: Brightness threshold for black/white conversion (0-255)
+            crop: Store each frame's bounding box instead of the full screen
         """
         self.width = width
         self.height = height
         self.threshold = threshold
+        self.crop = crop
     
     def process_frame(self, frame):
         """
@@ -40,6 +48,23 @@ class GifToBitmapConverter:
         Returns:
             List of bytes representing the bitmap
         """
+        return self._image_to_bitmap(self._frame_to_monochrome(frame))
+    
+    def _crop_to_content(self, image):
+        """
+        Crop a monochrome frame to its content rect and convert it to bitmap bytes
+        
+        Returns (bitmap bytes, (x, y, width, height, fill)), where fill is the
+        bit value (0 or 1) of every pixel outside the rect
+        """
+        rect = self._content_rect(image)
+        x, y, width, height, _ = rect
+        return self._image_to_bitmap(image.crop((x, y, x + width, y + height))), rect
+    
+    def _frame_to_monochrome(self, frame):
+        """
+        Resize, center and threshold a frame into a full-size mode '1' image
+        """
         # Convert to RGB if needed
         if frame.mode == 'P':
             frame = frame.convert('RGBA')
@@ -64,10 +89,37 @@ class GifToBitmapConverter:
         gray = ImageOps.grayscale(result)
         
         # Convert to pure black and white using threshold
-        bw = gray.point(lambda x: 255 if x > self.threshold else 0, mode='1')
+        return gray.point(lambda x: 255 if x > self.threshold else 0, mode='1')
+    
+    def _content_rect(self, image):
+        """
+        Find the byte-aligned bounding box of pixels that differ from the background
         
-        # Convert to bitmap array (horizontal byte format for Adafruit_GFX)
-        return self._image_to_bitmap(bw)
+        The background is whichever value covers most of the image border.
+        Horizontal bounds are widened to multiples of 8 so cropped rows stay
+        byte-aligned with the full-frame layout.
+        
+        Returns:
+            Tuple (x, y, width, height, fill)
+        """
+        width, height = image.size
+        border = (image.crop((0, 0, width, 1)).histogram()[255]
+                  + image.crop((0, height - 1, width, height)).histogram()[255]
+                  + image.crop((0, 1, 1, height - 1)).histogram()[255]
+                  + image.crop((width - 1, 1, width, height - 1)).histogram()[255])
+        fill = 1 if border * 2 >= 2 * (width + height) - 4 else 0
+        
+        # getbbox() finds non-zero pixels, so invert white backgrounds first
+        content = ImageOps.invert(image.convert('L')) if fill else image
+        bbox = content.getbbox()
+        if bbox is None:
+            # Blank frame: keep a single byte so the C array is not empty
+            return (0, 0, 8, 1, fill)
+        
+        left, top, right, bottom = bbox
+        left = left // 8 * 8
+        right = min((right + 7) // 8 * 8, (width + 7) // 8 * 8)
+        return (left, top, right - left, bottom - top, fill)
     
     def _image_to_bitmap(self, image):
         """
@@ -78,17 +130,18 @@ class GifToBitmapConverter:
         """
         pixels = list(image.getdata())
         bitmap = []
+        width, height = image.size
         
         # Process row by row, 8 pixels at a time horizontally
-        bytes_per_row = (self.width + 7) // 8
+        bytes_per_row = (width + 7) // 8
         
-        for y in range(self.height):
+        for y in range(height):
             for byte_x in range(bytes_per_row):
                 byte_val = 0
                 for bit in range(8):
                     x = byte_x * 8 + bit
-                    if x < self.width:
-                        pixel_index = y * self.width + x
+                    if x < width:
+                        pixel_index = y * width + x
                         # White pixels = 1, Black pixels = 0 (inverted for display)
                         if pixels[pixel_index] > 0:
                             byte_val |= (1 << (7 - bit))
@@ -154,6 +207,8 @@ class GifToBitmapConverter:
         img = Image.open(gif_path)
         frames = []
         frame_durations = []
+        rects = [] if self.crop else None
+        monochrome = []
         
         print(f"Processing: {gif_path.name}")
         
@@ -166,33 +221,59 @@ class GifToBitmapConverter:
             frame_durations.append(duration)
             
             # Process frame
-            bitmap = self.process_frame(frame.copy())
+            if self.crop:
+                bw = self._frame_to_monochrome(frame.copy())
+                bitmap, rect = self._crop_to_content(bw)
+                monochrome.append(bw)
+                rects.append(rect)
+            else:
+                bitmap = self.process_frame(frame.copy())
             frames.append(bitmap)
             
             print(f"  Frame {i+1}/{img.n_frames if hasattr(img, 'n_frames') else '?'} processed (duration: {duration}ms)")
         
+        full_bytes = len(frames) * ((self.width + 7) // 8) * self.height
+        stored_bytes = sum(len(bitmap) for bitmap in frames)
+        if rects is not None:
+            stored_bytes += len(rects) * RECT_BYTES
+            # Content that fills the screen gains nothing from cropping
+            if stored_bytes >= full_bytes:
+                print("  Cropping saves no flash, keeping full frames")
+                frames = [self._image_to_bitmap(bw) for bw in monochrome]
+                rects = None
+                stored_bytes = full_bytes
+        
         # Generate C header file
-        self._generate_header_file(gif_path.stem, frames, frame_durations, output_path)
+        self._generate_header_file(gif_path.stem, frames, frame_durations, output_path, rects)
         
         return {
             'input': str(gif_path),
             'output': str(output_path),
             'frames': len(frames),
             'size': f"{self.width}x{self.height}",
-            'total_duration': sum(frame_durations)
+            'total_duration': sum(frame_durations),
+            'bytes': stored_bytes,
+            'full_bytes': full_bytes
         }
     
-    def _generate_header_file(self, name, frames, durations, output_path):
+    def _generate_header_file(self, name, frames, durations, output_path, rects=None,
+                              source=None, generator="gif2bitmap.py"):
         """
         Generate C header file with all frames
+        
+        When rects is given (cropped mode), frames hold only their bounding
+        boxes and a {name}_rects array of (x, y, width, height, fill) is added.
+        source and generator label the header comment (default: {name}.gif,
+        gif2bitmap.py) for frames that did not come from a GIF.
         """
         # Sanitize name for C identifier
         c_name = ''.join(c if c.isalnum() else '_' for c in name).lower()
         
         lines = []
-        lines.append(f"// Auto-generated bitmap data from {name}.gif")
-        lines.append(f"// Frames: {len(frames)}, Size: {self.width}x{self.height}")
-        lines.append(f"// Generated by gif2bitmap.py")
+        lines.append(f"// Auto-generated bitmap data from {source or name + '.gif'}")
+        cropped = " (cropped)" if rects is not None else ""
+        lines.append(f"// Frames: {len(frames)}, Size: {self.width}x{self.height}{cropped}")
+        lines.append(f"// Generated by {generator}")
         lines.append("")
         lines.append(f"#ifndef {c_name.upper()}_BITMAP_H")
         lines.append(f"#define {c_name.upper()}_BITMAP_H")
@@ -207,7 +288,12 @@ class GifToBitmapConverter:
         
         # Generate frame arrays
         for i, (bitmap, duration) in enumerate(zip(frames, durations)):
-            lines.append(f"// Frame {i} (duration: {duration}ms)")
+            if rects is not None:
+                x, y, width, height, fill = rects[i]
+                lines.append(f"// Frame {i} (duration: {duration}ms, "
+                             f"rect: {width}x{height} at {x},{y}, fill: {fill})")
+            else:
+                lines.append(f"// Frame {i} (duration: {duration}ms)")
             lines.append(self.bitmap_to_c_array(bitmap, c_name, i))
             lines.append("")
         
@@ -228,6 +314,16 @@ class GifToBitmapConverter:
         lines.append("};")
         lines.append("")
         
+        # Generate per-frame crop rects
+        if rects is not None:
+            lines.append(f"// Frame rects: x, y, width, height, fill (background bit outside the rect)")
+            lines.append(f"const uint8_t {c_name}_rects[] PROGMEM = {{")
+            for i, rect in enumerate(rects):
+                comma = "," if i < len(rects) - 1 else ""
+                lines.append(f"  {', '.join(str(v) for v in rect)}{comma}")
+            lines.append("};")
+            lines.append("")
+        
         lines.append(f"#endif // {c_name.upper()}_BITMAP_H")
         lines.append("")
         
@@ -236,10 +332,33 @@ class GifToBitmapConverter:
             f.write('\n'.join(lines))
         
         print(f"✓ Generated: {output_path}")
-        print(f"  Total size: {len(frames) * len(frames[0])} bytes")
+        total_size = sum(len(bitmap) for bitmap in frames)
+        if rects is not None:
+            total_size += len(rects) * RECT_BYTES
+        print(f"  Total size: {total_size} bytes")
         print(f"  Animation duration: {sum(durations)}ms")
 
 
+def print_flash_report(results):
+    """
+    Print flash usage per animation: full-screen frames vs cropped frames
+    """
+    print(f"{'Animation':<24} {'Full':>9} {'Cropped':>9} {'Saved':>9} {'Saved %':>8}")
+    print("-" * 63)
+    for result in results:
+        name = Path(result['input']).stem
+        saved = result['full_bytes'] - result['bytes']
+        print(f"{name:<24} {result['full_bytes']:>9} {result['bytes']:>9} {saved:>9} "
+              f"{100 * saved / result['full_bytes']:>7.1f}%")
+    
+    if len(results) > 1:
+        full = sum(r['full_bytes'] for r in results)
+        cropped = sum(r['bytes'] for r in results)
+        print("-" * 63)
+        print(f"{'Total':<24} {full:>9} {cropped:>9} {full - cropped:>9} "
+              f"{100 * (full - cropped) / full:>7.1f}%")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Convert GIF files to monochrome bitmap arrays for ESP32 displays',
@@ -257,6 +376,9 @@ Examples:
   
   # Limit frames (useful for large GIFs)
   python3 gif2bitmap.py large_anim.gif --max-frames 30
+  
+  # Store cropped frames and report flash saved per animation
+  python3 gif2bitmap.py gif/ --batch --crop
         """
     )
     
@@ -269,6 +391,8 @@ Examples:
     parser.add_argument('-m', '--max-frames', type=int, help='Maximum number of frames to extract')
     parser.add_argument('-b', '--batch', action='store_true', help='Batch convert all GIFs in directory')
     parser.add_argument('--output-dir', help='Output directory for batch conversion')
+    parser.add_argument('-c', '--crop', action='store_true',
+                       help='Store only each frame\'s content bounding box (reports flash saved)')
     
     args = parser.parse_args()
     
@@ -276,7 +400,8 @@ Examples:
     converter = GifToBitmapConverter(
         width=args.width,
         height=args.height,
-        threshold=args.threshold
+        threshold=args.threshold,
+        crop=args.crop
     )
     
     input_path = Path(args.input)
@@ -314,6 +439,10 @@ Examples:
         print(f"Conversion complete! {len(results)}/{len(gif_files)} files converted")
         print(f"Output directory: {output_dir}")
         
+        if args.crop and results:
+            print()
+            print_flash_report(results)
+        
     # Single file mode
     else:
         if not input_path.is_file():
@@ -329,6 +458,9 @@ Examples:
             print(f"Output: {result['output']}")
             print(f"Frames: {result['frames']}")
             print(f"Size:   {result['size']}")
+            if args.crop:
+                print()
+                print_flash_report([result])
         except Exception as e:
             print(f"Error: {e}")
             sys.exit(1)
@@ -0,0 +1,638 @@
+#!/usr/bin/env python3
+"""
+Vectorized Rasterizer for ESP32 Mochi Display
+Renders whole animations as one NumPy array instead of frame by frame
+
+Every shape is evaluated as a boolean mask over a (frames, 64, 128) grid.
+Shape parameters may be scalars or arrays: a leading per-frame axis (and any
+extra axes, e.g. one per dot or per spoke) broadcasts against the pixel grid,
+so per-frame values like `angle`, `progress` or `flicker` are passed as arrays
+and every frame is drawn in a single pass.
+
+This is not a speed-up over Pillow: drawing 30 frames still takes about 1-3x
+as long as the PIL generators. What it gives is whole animations as arrays,
+bit-packed without the GIF round trip.
+
+Usage:
+    python3 raster.py                         # Compare against the PIL generators
+    python3 raster.py --check                 # Check ellipses and rings against Pillow
+    python3 raster.py --header --output-dir out/   # Write C headers to out/
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+WIDTH = 128
+HEIGHT = 64
+FRAMES = 30
+FRAME_DURATION = 60  # Same per-frame delay as create_custom_animations.save_as_gif
+
+
+def _rasterize(kernel, x0, y0, x1, y1, union=False):
+    """
+    Evaluate `kernel(X, Y, take)` only inside each shape's bounding box
+
+    The bounds broadcast to the shape's batch shape S (e.g. (frames, dots)).
+    Every shape gets a window of exactly its own box, clipped to the screen,
+    and all windows are laid out row by row in one flat run of pixels. X and Y
+    are the flat pixel coordinates. take(v) gathers an S-shaped parameter onto
+    those pixels. Returns a boolean mask of shape S + (HEIGHT, WIDTH), or with
+    the last batch axis ORed away when `union` is set.
+    """
+    x0, y0, x1, y1 = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64)
+                                           for v in (x0, y0, x1, y1)))
+    shape = x0.shape
+    left = np.clip(np.floor(x0), 0, WIDTH).astype(np.intp).ravel()
+    top = np.clip(np.floor(y0), 0, HEIGHT).astype(np.intp).ravel()
+    win_w = np.maximum(np.clip(np.ceil(x1) + 1, 0, WIDTH).astype(np.intp).ravel() - left, 0)
+    win_h = np.maximum(np.clip(np.ceil(y1) + 1, 0, HEIGHT).astype(np.intp).ravel() - top, 0)
+
+    # Index the (few) window rows first, so each per-pixel array is a single
+    # repeat and no per-pixel division is needed
+    row_owner = np.repeat(np.arange(left.size), win_h)
+    row_y = top[row_owner] + np.arange(row_owner.size) - np.repeat(np.cumsum(win_h) - win_h, win_h)
+    row_w = win_w[row_owner]
+    row_start = np.cumsum(row_w) - row_w
+    row_left = left[row_owner]
+
+    pixel = np.arange(int(row_w.sum()))
+    owner = np.repeat(row_owner, row_w)
+    X = pixel - np.repeat(row_start - row_left, row_w)
+    Y = np.repeat(row_y, row_w)
+
+    def take(value):
+        return np.broadcast_to(value, shape).ravel()[owner]
+
+    hit = kernel(X, Y, take)
+    slot = row_owner
+    if union:
+        slot, shape = row_owner // shape[-1], shape[:-1]
+    flat = pixel + np.repeat((slot * HEIGHT + row_y) * WIDTH + row_left - row_start, row_w)
+    mask = np.zeros(shape + (HEIGHT, WIDTH), dtype=bool)
+    mask.reshape(-1)[flat[hit]] = True
+    return mask
+
+
+def _quarter(a, b):
+    """
+    Pillow's quarter_next(): integer points along the top-right quarter of an
+    ellipse with semi-axes a, b in doubled coordinates, from (a, b % 2) to (a % 2, b)
+    """
+    if a < 0 or b < 0:
+        return
+
+    def delta(x, y):
+        return abs(a * a * y * y + b * b * x * x - a * a * b * b)
+
+    x, y = a, b % 2
+    while True:
+        yield x, y
+        if x == a % 2 and y == b:
+            return
+        nx, ny = x, y + 2
+        if x > 1:
+            best = delta(nx, ny)
+            if delta(x - 2, y + 2) < best:
+                nx, ny, best = x - 2, y + 2, delta(x - 2, y + 2)
+            if delta(x - 2, y) < best:
+                nx, ny = x - 2, y
+        x, y = nx, ny
+
+
+@functools.lru_cache(maxsize=None)
+def _ellipse_spans(a, b, width):
+    """
+    Per-row spans of an ellipse of the given outline width, as Pillow draws them
+
+    A port of ellipse_init() / ellipse_next(): a and b are the bounding box
+    width and height minus one (semi-axes in doubled coordinates). Returns
+    (inner, outer) arrays indexed by doubled row offset |y|; pixels with
+    inner <= |doubled x offset| <= outer are drawn. Rows never reached are
+    left empty (inner > outer).
+    """
+    inner = np.full(max(b, 0) + 1, 1)
+    outer = np.full(max(b, 0) + 1, -1)
+    leftmost = a % 2
+    st_o = _quarter(a, b)
+    first = next(st_o, None)
+    if width < 1 or first is None:
+        return inner, outer
+    st_i = _quarter(a - 2 * (width - 1), b - 2 * (width - 1))
+    pr, py = first
+    pl = leftmost
+    while True:
+        y, l, r = py, pl, pr
+        finished = True
+        for cx, cy in st_o:
+            if cy > y:
+                pr, py = cx, cy
+                finished = False
+                break
+        pl = leftmost
+        for cx, cy in st_i:
+            if cy > y:
+                pl = cx
+                break
+            l = cx
+        inner[y], outer[y] = l, r
+        if finished:
+            return inner, outer
+
+
+def _ellipse_kernel(x0, y0, x1, y1, width=None):
+    """
+    Kernel for Pillow's ellipse spans; width=None draws the filled ellipse
+    """
+    x0, y0, x1, y1 = np.broadcast_arrays(*(np.rint(np.asarray(v, dtype=np.float64)).astype(np.intp)
+                                           for v in (x0, y0, x1, y1)))
+    a, b = x1 - x0, y1 - y0
+
+    # One span table per shape, built once per distinct box size and flattened
+    # so each pixel needs a single lookup. Rows past a shape's own height, and
+    # empty boxes (e.g. the inside of a ring thicker than its radius), keep
+    # inner > outer; the extra last row catches every offset beyond the table
+    rows = max(int(b.max(initial=0)), 0) + 2
+    inner = np.full(a.shape + (rows,), 1)
+    outer = np.full(a.shape + (rows,), -1)
+    for size in set(zip(a.ravel().tolist(), b.ravel().tolist())):
+        if min(size) >= 0:
+            spans = _ellipse_spans(*size, sum(size) if width is None else width)
+            same = (a == size[0]) & (b == size[1])
+            inner[same, :size[1] + 1], outer[same, :size[1] + 1] = spans
+    inner, outer = inner.ravel(), outer.ravel()
+    table_row = np.arange(a.size).reshape(a.shape) * rows
+    center_x, center_y = x0 + x1, y0 + y1
+
+    def kernel(X, Y, take):
+        row = np.minimum(np.abs(2 * Y - take(center_y)), rows - 1) + take(table_row)
+        dx = np.abs(2 * X - take(center_x))
+        return (dx >= inner[row]) & (dx <= outer[row])
+
+    return kernel
+
+
+def _line_kernel(x0, y0, x1, y1, width):
+    x0, y0, x1, y1 = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64)
+                                           for v in (x0, y0, x1, y1)))
+    dx, dy = x1 - x0, y1 - y0
+    # Per-segment terms are worked out once here, so the per-pixel work below
+    # is plain float arithmetic on gathered values
+    if width <= 1:
+        # One pixel per step along the major axis, like Bresenham: t runs
+        # along the major axis and the offset is measured across it
+        x_major = np.abs(dx) >= np.abs(dy)
+        major = np.where(x_major, dx, dy)
+        inv = 1 / np.where(major == 0, 1, major)
+        terms = (x0, y0, np.where(x_major, inv, 0), np.where(x_major, 0, inv),
+                 np.where(x_major, dy, dx), x_major)
+
+        def kernel(X, Y, take):
+            ax, ay, ux, uy, across, x_major = (take(v) for v in terms)
+            px, py = X - ax, Y - ay
+            t = px * ux + py * uy
+            offset = np.where(x_major, py, px) - t * across
+            return (t >= 0) & (t <= 1) & (offset >= -0.5) & (offset < 0.5)
+
+        return kernel
+
+    if width % 2 == 0:
+        # PIL grows even-width lines half a pixel to one side of the centre line
+        x0, y0 = x0 + np.sign(dy) / 2, y0 + np.sign(dx) / 2
+    length_sq = dx * dx + dy * dy
+    inv = 1 / np.where(length_sq == 0, 1, length_sq)  # Degenerate segments become points
+    terms = (x0, y0, dx, dy, dx * inv, dy * inv)
+
+    def kernel(X, Y, take):
+        ax, ay, dx, dy, ux, uy = (take(v) for v in terms)
+        px, py = X - ax, Y - ay
+        # Project each pixel onto the segment, then measure the distance to it
+        t = np.clip(px * ux + py * uy, 0, 1)
+        px -= t * dx
+        py -= t * dy
+        return px * px + py * py <= (width / 2) ** 2
+
+    return kernel
+
+
+def frame_mask(active):
+    """Lift a per-frame boolean array so it can gate a (frames, H, W) mask"""
+    return np.asarray(active, dtype=bool)[:, None, None]
+
+
+def blank(frames):
+    """Create an empty canvas: True = black (ink), False = white background"""
+    return np.zeros((frames, HEIGHT, WIDTH), dtype=bool)
+
+
+def ellipse(x0, y0, x1, y1, union=False):
+    """
+    Filled ellipse inside the inclusive bounding box [x0, y0, x1, y1]
+
+    Corners are rounded to whole pixels and rows use Pillow's own span
+    algorithm, so the result is the same as ImageDraw.ellipse(..., fill=...)
+    (see check_ellipses()).
+    With `union`, shapes along the last batch axis (e.g. all dots of a frame)
+    are ORed into one mask.
+    """
+    return _rasterize(_ellipse_kernel(x0, y0, x1, y1), x0, y0, x1, y1, union)
+
+
+def circle(cx, cy, r):
+    """Filled circle covering the bounding box [cx - r, cy - r, cx + r, cy + r]"""
+    cx, cy, r = np.asarray(cx), np.asarray(cy), np.asarray(r)
+    return ellipse(cx - r, cy - r, cx + r, cy + r)
+
+
+def ring(x0, y0, x1, y1, width=1):
+    """Ellipse outline of the given width, the same as ImageDraw.ellipse(..., width=w)"""
+    return _rasterize(_ellipse_kernel(x0, y0, x1, y1, width), x0, y0, x1, y1)
+
+
+def arc(x0, y0, x1, y1, start, end, width=1):
+    """
+    Elliptical arc from `start` to `end` degrees (clockwise, 0 = 3 o'clock)
+
+    Matches ImageDraw.arc(..., width=w) up to edge pixels near the cut ends.
+    """
+    x0, y0, x1, y1 = (np.asarray(v, dtype=np.float64) for v in (x0, y0, x1, y1))
+    start, end = np.asarray(start) % 360, np.asarray(end) % 360
+    ring_kernel = _ellipse_kernel(x0, y0, x1, y1, width)
+
+    def kernel(X, Y, take):
+        angle = np.degrees(np.arctan2(Y - take((y0 + y1) / 2),
+                                      X - take((x0 + x1) / 2))) % 360
+        lo, hi = take(start), take(end)
+        sweep = np.where(lo <= hi, (angle >= lo) & (angle <= hi),
+                         (angle >= lo) | (angle <= hi))
+        return ring_kernel(X, Y, take) & sweep
+
+    return _rasterize(kernel, x0, y0, x1, y1)
+
+
+def rectangle(x0, y0, x1, y1):
+    """Filled rectangle with inclusive corners, like ImageDraw.rectangle"""
+    return _rasterize(lambda X, Y, take: np.ones(X.shape, dtype=bool), x0, y0, x1, y1)
+
+
+def line(x0, y0, x1, y1, width=1, union=False):
+    """
+    Line segment of the given width, like ImageDraw.line(..., width=w)
+
+    `union` ORs the segments along the last batch axis into one mask.
+    """
+    x0, y0, x1, y1 = (np.asarray(v, dtype=np.float64) for v in (x0, y0, x1, y1))
+    # Even widths sit half a pixel off the centre line (see _line_kernel)
+    pad = max(width, 1) / 2 + (0.5 if width % 2 == 0 else 0)
+    return _rasterize(_line_kernel(x0, y0, x1, y1, width),
+                      np.minimum(x0, x1) - pad, np.minimum(y0, y1) - pad,
+                      np.maximum(x0, x1) + pad, np.maximum(y0, y1) + pad, union)
+
+
+def polyline(xs, ys, width=1, closed=False):
+    """
+    Connected line segments through points along the last axis of xs / ys
+
+    Returns one mask per leading index (e.g. per frame).
+    """
+    xs, ys = np.asarray(xs), np.asarray(ys)
+    if closed:
+        xs2, ys2 = np.roll(xs, -1, axis=-1), np.roll(ys, -1, axis=-1)
+    else:
+        xs, ys, xs2, ys2 = xs[..., :-1], ys[..., :-1], xs[..., 1:], ys[..., 1:]
+    return line(xs, ys, xs2, ys2, width, union=True)
+
+
+def _polygon_fill(xs, ys):
+    """
+    Even-odd interior of a polygon, one scanline pass per row
+
+    Each edge crossing toggles every pixel from ceil(x) onwards, so a running
+    XOR along the row gives the crossing parity without any per-pixel windows.
+    Only the rows between the lowest and highest vertex are scanned.
+    """
+    xs, ys = np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+    top = int(np.clip(np.floor(ys.min()), 0, HEIGHT))
+    bottom = int(np.clip(np.ceil(ys.max()) + 1, top, HEIGHT))
+    xi, yi = xs[..., None, :], ys[..., None, :]
+    xj, yj = np.roll(xi, -1, axis=-1), np.roll(yi, -1, axis=-1)
+    row = np.arange(top, bottom)[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_cross = xi + (row - yi) * (xj - xi) / (yj - yi)
+    column = np.where((yi > row) != (yj > row),
+                      np.clip(np.ceil(x_cross), 0, WIDTH), WIDTH).astype(np.intp)
+
+    batch, rows = xs.shape[:-1], bottom - top
+    lines = int(np.prod(batch, dtype=np.intp)) * rows
+    line_index = np.arange(lines).reshape(batch + (rows, 1))
+    toggles = np.bincount((line_index * (WIDTH + 1) + column).ravel(),
+                          minlength=lines * (WIDTH + 1)).astype(np.uint8)
+    parity = np.bitwise_xor.accumulate(toggles.reshape(batch + (rows, WIDTH + 1)), axis=-1)
+    mask = np.zeros(batch + (HEIGHT, WIDTH), dtype=bool)
+    mask[..., top:bottom, :] = parity[..., :WIDTH] & 1
+    return mask
+
+
+def polygon(xs, ys):
+    """
+    Filled polygon (even-odd rule) through vertices along the last axis
+
+    Includes the boundary pixels, like ImageDraw.polygon(..., fill=...).
+    """
+    return _polygon_fill(xs, ys) | polyline(xs, ys, closed=True)
+
+
+def polygon_outline(xs, ys, width=1):
+    """
+    Polygon outline, like ImageDraw.polygon(..., outline=..., width=w)
+
+    Wide outlines grow inwards only: a 2w - 1 stroke clipped to the fill.
+    """
+    if width <= 1:
+        return polyline(xs, ys, closed=True)
+    return polyline(xs, ys, width * 2 - 1, closed=True) & _polygon_fill(xs, ys)
+
+
+def pack(canvas):
+    """
+    Bit-pack a (frames, H, W) canvas into firmware frames
+
+    Same layout as GifToBitmapConverter._image_to_bitmap: horizontal bytes,
+    MSB first, white pixels = 1. Returns a (frames, H * ceil(W / 8)) uint8 array.
+    """
+    frames = canvas.shape[0]
+    return np.packbits(~canvas, axis=-1).reshape(frames, -1)
+
+
+# ===== PORTED ANIMATIONS =====
+# Vectorized equivalents of the generators in create_custom_animations.py
+
+def render_wink(frames=FRAMES):
+    """Winking face: right eye closes for part of the cycle"""
+    i = np.arange(frames)
+    face_x, face_y, face_radius = WIDTH // 2, HEIGHT // 2, 28
+    eye_y = face_y - 8
+    left_eye_x, right_eye_x = face_x - 12, face_x + 12
+    wink_cycle = (i % frames) / frames
+    winking = frame_mask((wink_cycle > 0.3) & (wink_cycle < 0.5))
+
+    canvas = blank(frames)
+    canvas |= ring(face_x - face_radius, face_y - face_radius,
+                   face_x + face_radius, face_y + face_radius, width=2)
+    canvas |= ellipse(left_eye_x - 4, eye_y - 4, left_eye_x + 4, eye_y + 4)
+    canvas |= winking & line(right_eye_x - 5, eye_y, right_eye_x + 5, eye_y, width=2)
+    canvas |= ~winking & ellipse(right_eye_x - 4, eye_y - 4, right_eye_x + 4, eye_y + 4)
+    smile_y = face_y + 8
+    canvas |= arc(face_x - 15, smile_y - 8, face_x + 15, smile_y + 8, 0, 180, width=2)
+    return canvas
+
+
+def render_dizzy(frames=FRAMES):
+    """Counter-rotating spiral eyes with a wavy mouth"""
+    i = np.arange(frames)
+    face_x, face_y, face_radius = WIDTH // 2, HEIGHT // 2, 28
+    eye_y = face_y - 8
+    angle = (i / frames) * 2 * math.pi
+
+    canvas = blank(frames)
+    canvas |= ring(face_x - face_radius, face_y - face_radius,
+                   face_x + face_radius, face_y + face_radius, width=2)
+
+    # One axis per spiral dot: (frames, 8) centres, all drawn at once
+    j = np.arange(8)
+    radius = j * 2
+    for center_x, direction in ((face_x - 12, 1), (face_x + 12, -1)):
+        spiral_angle = direction * angle[:, None] + j * math.pi / 4
+        x = center_x + np.trunc(np.cos(spiral_angle) * radius)
+        y = eye_y + np.trunc(np.sin(spiral_angle) * radius)
+        canvas |= ellipse(x - 1, y - 1, x + 1, y + 1, union=True)
+
+    mouth_y = face_y + 10
+    mx = np.arange(-15, 16, 2)
+    my = mouth_y + np.trunc(np.sin((mx + i[:, None] * 3) * 0.3) * 3)
+    canvas |= polyline(np.broadcast_to(face_x + mx, my.shape), my, width=2)
+    return canvas
+
+
+def render_cool(frames=FRAMES):
+    """Sunglasses sliding down onto the face"""
+    i = np.arange(frames)
+    face_x, face_y, face_radius = WIDTH // 2, HEIGHT // 2, 28
+    progress = np.minimum(1.0, i / (frames / 2))
+    glasses_y = face_y - 20 + np.trunc(progress * 12)
+    left_x, right_x = face_x - 12, face_x + 12
+
+    canvas = blank(frames)
+    canvas |= ring(face_x - face_radius, face_y - face_radius,
+                   face_x + face_radius, face_y + face_radius, width=2)
+    canvas |= rectangle(left_x - 8, glasses_y - 5, left_x + 8, glasses_y + 5)
+    canvas |= rectangle(right_x - 8, glasses_y - 5, right_x + 8, glasses_y + 5)
+    canvas |= line(left_x + 8, glasses_y, right_x - 8, glasses_y, width=2)
+    smirk_y = face_y + 10
+    canvas |= arc(face_x - 10, smirk_y - 5, face_x + 12, smirk_y + 5, 0, 180, width=2)
+    return canvas
+
+
+def render_fire(frames=FRAMES):
+    """Flickering outer and inner flame outlines"""
+    i = np.arange(frames)
+    center_x, center_y = WIDTH // 2, HEIGHT // 2
+    phase = (i / frames * 2 * math.pi)[:, None]
+
+    outer = np.radians(np.arange(0, 360, 15))
+    flicker = np.sin(phase + outer * 3) * 3
+    radius = 25 + flicker + np.abs(np.sin(outer * 2)) * 5
+    outer_x = center_x + np.trunc(np.cos(outer) * radius)
+    outer_y = center_y + np.trunc(np.sin(outer) * radius * 0.8) - 5
+
+    inner = np.radians(np.arange(0, 360, 20))
+    flicker = np.sin(phase * 1.5 + inner * 2) * 2
+    radius = 15 + flicker
+    inner_x = center_x + np.trunc(np.cos(inner) * radius)
+    inner_y = center_y + np.trunc(np.sin(inner) * radius * 0.8)
+
+    canvas = blank(frames)
+    canvas |= polygon_outline(outer_x, outer_y, width=2)
+    canvas |= polygon_outline(inner_x, inner_y)
+    return canvas
+
+
+def render_explode(frames=FRAMES):
+    """Shocked face that blows up into radiating lines and dots"""
+    i = np.arange(frames)
+    face_x, face_y, face_radius = WIDTH // 2, HEIGHT // 2, 28
+    progress = i / frames
+    shocked = progress < 0.5
+    canvas = blank(frames)
+
+    # Phase 1: face with growing eyes and mouth, drawn on its frames only
+    eye_size = 3 + np.trunc(progress[shocked] * 10)
+    mouth_size = np.trunc(progress[shocked] * 15)
+    face = ring(face_x - face_radius, face_y - face_radius,
+                face_x + face_radius, face_y + face_radius, width=2)
+    for eye_x in (face_x - 12, face_x + 12):
+        face = face | ellipse(eye_x - eye_size, face_y - 8 - eye_size,
+                              eye_x + eye_size, face_y - 8 + eye_size)
+    face = face | ellipse(face_x - mouth_size, face_y + 8 - mouth_size // 2,
+                          face_x + mouth_size, face_y + 8 + mouth_size // 2)
+    canvas[shocked] = face
+
+    # Phase 2: shaking face with one axis per spoke, (frames, 12)
+    i = i[~shocked]
+    explosion_progress = ((progress[~shocked] - 0.5) * 2)[:, None]
+    shake_x = np.trunc(np.sin(i * 2) * 2)
+    shake_y = np.trunc(np.cos(i * 2) * 2)
+    face = ring(face_x - face_radius + shake_x, face_y - face_radius + shake_y,
+                face_x + face_radius + shake_x, face_y + face_radius + shake_y, width=2)
+
+    angle = np.arange(12) / 12 * 2 * math.pi
+    length = face_radius + explosion_progress * 20
+    start_x = face_x + np.trunc(np.cos(angle) * face_radius)
+    start_y = face_y + np.trunc(np.sin(angle) * face_radius)
+    end_x = face_x + np.trunc(np.cos(angle) * length)
+    end_y = face_y + np.trunc(np.sin(angle) * length)
+    face |= line(start_x, start_y, end_x, end_y, width=2, union=True)
+
+    burst = explosion_progress[:, 0] > 0.5
+    dot_x = end_x[burst] + np.trunc(np.cos(angle) * 5)
+    dot_y = end_y[burst] + np.trunc(np.sin(angle) * 5)
+    face[burst] |= ellipse(dot_x - 2, dot_y - 2, dot_x + 2, dot_y + 2, union=True)
+    canvas[~shocked] = face
+    return canvas
+
+
+RENDERERS = {
+    'wink': render_wink,
+    'dizzy': render_dizzy,
+    'cool': render_cool,
+    'fire': render_fire,
+    'explode': render_explode,
+}
+
+
+def compare(repeat=3):
+    """
+    Render every animation both ways and report pixel mismatches and timing
+
+    The PIL generators are the reference; frames are thresholded exactly as
+    gif2bitmap.py does before comparing. "draw" times only the shapes, "+pack"
+    adds pack() on both sides, so the columns compare the rasterizers alone.
+    """
+    import create_custom_animations as reference
+
+    def timed(fn):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = fn()
+        return result, (time.perf_counter() - start) / repeat * 1000
+
+    print(f"{'Animation':<10} {'PIL draw':>9} {'NumPy draw':>11} "
+          f"{'PIL +pack':>10} {'NumPy +pack':>12} {'Diff px':>8} {'Diff %':>7}")
+    for name, render in RENDERERS.items():
+        create = getattr(reference, f"create_{name}_animation")
+        with contextlib.redirect_stdout(io.StringIO()):
+            images, pil_draw = timed(create)
+        canvas, np_draw = timed(render)
+
+        expected = np.stack([np.asarray(img.convert('L')) <= 128 for img in images])
+        _, pil_pack = timed(lambda: pack(expected))
+        _, np_pack = timed(lambda: pack(canvas))
+        diff = int(np.count_nonzero(expected != canvas))
+        print(f"{name:<10} {pil_draw:>7.1f}ms {np_draw:>9.1f}ms "
+              f"{pil_draw + pil_pack:>8.1f}ms {np_draw + np_pack:>10.1f}ms "
+              f"{diff:>8} {100 * diff / canvas.size:>6.2f}%")
+
+
+def merge_duplicate_frames(frames, durations):
+    """
+    Merge identical consecutive frames, adding up their durations
+
+    Matches what saving a GIF does, so headers written from here have the same
+    frame counts as the GIF -> gif2bitmap.py pipeline (e.g. WINK_FRAMES 3).
+    """
+    merged_frames, merged_durations = [frames[0]], [durations[0]]
+    for frame, duration in zip(frames[1:], durations[1:]):
+        if np.array_equal(frame, merged_frames[-1]):
+            merged_durations[-1] += duration
+        else:
+            merged_frames.append(frame)
+            merged_durations.append(duration)
+    return merged_frames, merged_durations
+
+
+def check_ellipses(max_width=40, max_height=30):
+    """
+    Compare ellipse() and ring() with ImageDraw for every box size up to the limits
+
+    Covers filled ellipses and outline widths 1-3, including degenerate boxes
+    (0x0, single rows and columns). Prints each mismatch and returns the count.
+    """
+    from PIL import Image, ImageDraw
+
+    mismatches = 0
+    for w in range(max_width):
+        for h in range(max_height):
+            box = (4, 4, 4 + w, 4 + h)
+            for width in (None, 1, 2, 3):
+                image = Image.new('1', (WIDTH, HEIGHT), 0)
+                if width is None:
+                    ImageDraw.Draw(image).ellipse(box, fill=1)
+                    mask = ellipse(*box)
+                else:
+                    ImageDraw.Draw(image).ellipse(box, outline=1, width=width)
+                    mask = ring(*box, width=width)
+                diff = int(np.count_nonzero(np.asarray(image) != mask))
+                if diff:
+                    mismatches += 1
+                    label = 'filled' if width is None else f'width {width}'
+                    print(f"{w}x{h} {label}: {diff} px differ")
+    print(f"{mismatches} mismatching ellipses")
+    return mismatches
+
+
+def write_headers(output_dir):
+    """Render and bit-pack every animation straight into C headers"""
+    from gif2bitmap import GifToBitmapConverter
+
+    converter = GifToBitmapConverter(width=WIDTH, height=HEIGHT)
+    os.makedirs(output_dir, exist_ok=True)
+    for name, render in RENDERERS.items():
+        packed = pack(render())
+        frames, durations = merge_duplicate_frames(packed, [FRAME_DURATION] * len(packed))
+        output_path = os.path.join(output_dir, f"{name}_bitmap.h")
+        converter._generate_header_file(name, frames, durations, output_path,
+                                        source=f"render_{name}()", generator="raster.py")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Vectorized renderer for the custom Mochi animations')
+    parser.add_argument('--header', action='store_true',
+                        help='Write C headers instead of comparing against PIL')
+    parser.add_argument('--output-dir',
+                        help='Header output directory (required with --header)')
+    parser.add_argument('--check', action='store_true',
+                        help='Check ellipses and rings against Pillow for many box sizes')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Timing repetitions per animation (default: 3)')
+    args = parser.parse_args()
+
+    if args.header:
+        if not args.output_dir:
+            parser.error('--header needs --output-dir')
+        write_headers(args.output_dir)
+    elif args.check:
+        return 1 if check_ellipses() else 0
+    else:
+        compare(args.repeat)
+
+
+if __name__ == '__main__':
+    sys.exit(main())